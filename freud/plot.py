@@ -15,16 +15,56 @@ if _HAS_MPL:
     import matplotlib.pyplot as plt
     from matplotlib import cm
     from matplotlib.backends.backend_agg import FigureCanvasAgg
-    from matplotlib.collections import PatchCollection
+    from matplotlib.collections import PolyCollection
     from matplotlib.colorbar import Colorbar
-    from matplotlib.patches import Polygon
     from matplotlib.ticker import FormatStrFormatter, MaxNLocator
     from mpl_toolkits.axes_grid1.axes_divider import make_axes_locatable
     from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
 else:
     msg = "matplotlib must be installed for freud.plot. "
     raise ImportError(msg)
 
+# Random number generator used to pick Voronoi cell colors.
+_RNG = np.random.default_rng()
+
+# Fractional corners of a 2D box, with the first point repeated so that the
+# drawn path is closed.
+_UNIT_CORNERS_2D = np.array(
+    [[0, 0, 0], [0, 1, 0], [1, 1, 0], [1, 0, 0], [0, 0, 0]], dtype=np.float64
+)
+
+# Fractional corners of a 3D box and the pairs of corners joined by its edges.
+_UNIT_CORNERS_3D = np.array(
+    [
+        [0, 0, 0],
+        [0, 0, 1],
+        [0, 1, 0],
+        [0, 1, 1],
+        [1, 0, 0],
+        [1, 0, 1],
+        [1, 1, 0],
+        [1, 1, 1],
+    ],
+    dtype=np.float64,
+)
+_UNIT_CUBE_EDGES = np.array(
+    [
+        [0, 1],
+        [1, 3],
+        [3, 2],
+        [2, 0],
+        [4, 5],
+        [5, 7],
+        [7, 6],
+        [6, 4],
+        [0, 4],
+        [1, 5],
+        [2, 6],
+        [3, 7],
+    ]
+)
+
 
 def _ax_to_bytes(ax):
     """Helper function to convert figure to png file.
@@ -36,11 +76,13 @@ def _ax_to_bytes(ax):
         bytes: Byte representation of the diagram in png format.
     """
     f = io.BytesIO()
-    # Sets an Agg backend so this figure can be rendered
     fig = ax.figure
-    FigureCanvasAgg(fig)
+    # Sets an Agg backend so this figure can be rendered, unless it has one
+    if not isinstance(fig.canvas, FigureCanvasAgg):
+        FigureCanvasAgg(fig)
     fig.savefig(f, format="png")
-    fig.clf()
+    # Release the figure so pyplot does not keep it alive
+    plt.close(fig)
     return f.getvalue()
 
 
@@ -104,46 +146,21 @@ def box_plot(box, title=None, ax=None, image=None, *args, **kwargs):
 
             ax = fig.add_subplot(111, projection="3d")
 
+    color = kwargs.pop("color", "k")
     if box.is2D:
         # Draw 2D box
-        corners = [[0, 0, 0], [0, 1, 0], [1, 1, 0], [1, 0, 0]]
-        # Need to copy the last point so that the box is closed.
-        corners.append(corners[0])
-        corners = np.asarray(corners)
-        corners += np.asarray(image)
+        corners = _UNIT_CORNERS_2D + np.asarray(image)
         corners = box.make_absolute(corners)[:, :2]
-        color = kwargs.pop("color", "k")
         ax.plot(corners[:, 0], corners[:, 1], color=color, *args, **kwargs)  # noqa: B026
         ax.set_aspect("equal", "datalim")
         ax.set_xlabel("$x$")
         ax.set_ylabel("$y$")
     else:
         # Draw 3D box
-        corners = np.array(
-            [
-                [0, 0, 0],
-                [0, 0, 1],
-                [0, 1, 0],
-                [0, 1, 1],
-                [1, 0, 0],
-                [1, 0, 1],
-                [1, 1, 0],
-                [1, 1, 1],
-            ]
-        )
-        corners += np.asarray(image)
+        corners = _UNIT_CORNERS_3D + np.asarray(image)
         corners = box.make_absolute(corners)
-        paths = [
-            corners[[0, 1, 3, 2, 0]],
-            corners[[4, 5, 7, 6, 4]],
-            corners[[0, 4]],
-            corners[[1, 5]],
-            corners[[2, 6]],
-            corners[[3, 7]],
-        ]
-        for path in paths:
-            color = kwargs.pop("color", "k")
-            ax.plot(path[:, 0], path[:, 1], path[:, 2], color=color)
+        # Draw all 12 edges as a single collection rather than one line each
+        ax.add_collection3d(Line3DCollection(corners[_UNIT_CUBE_EDGES], colors=color))
         ax.set_xlabel("$x$")
         ax.set_ylabel("$y$")
         ax.set_zlabel("$z$")
@@ -171,6 +188,7 @@ def system_plot(system, title=None, ax=None, *args, **kwargs):
             (Default value = :code:`None`).
     """
     system = freud.locality.NeighborQuery.from_system(system)
+    points = system.points
 
     if ax is None:
         fig = plt.figure()
@@ -183,25 +201,18 @@ def system_plot(system, title=None, ax=None, *args, **kwargs):
 
     if system.box.is2D:
         box_plot(system.box, ax=ax)
-        sc = ax.scatter(system.points[:, 0], system.points[:, 1], *args, **kwargs)
+        sc = ax.scatter(points[:, 0], points[:, 1], *args, **kwargs)
         ax.set_aspect("equal", "datalim")
     else:
         box_plot(system.box, ax=ax)
-        sc = ax.scatter(
-            system.points[:, 0],
-            system.points[:, 1],
-            system.points[:, 2],
-            *args,
-            **kwargs,
+        sc = ax.scatter(points[:, 0], points[:, 1], points[:, 2], *args, **kwargs)
+        box_min, box_max = system.box.make_absolute([[0, 0, 0], [1, 1, 1]])
+        points_min = points.min(axis=0)
+        points_max = points.max(axis=0)
+        limits = np.stack(
+            [np.minimum(box_min, points_min), np.maximum(box_max, points_max)],
+            axis=1,
         )
-        box_min = system.box.make_absolute([0, 0, 0])
-        box_max = system.box.make_absolute([1, 1, 1])
-        points_min = np.min(system.points, axis=0)
-        points_max = np.max(system.points, axis=0)
-        limits = [
-            [np.min([box_min[i], points_min[i]]), np.max([box_max[i], points_max[i]])]
-            for i in range(3)
-        ]
         _set_3d_axes_equal(ax, limits=limits)
 
     return ax, sc
@@ -251,11 +262,24 @@ def clusters_plot(keys, freqs, num_clusters_to_plot=10, ax=None):
     Returns:
         :class:`matplotlib.axes.Axes`: Axes object with the diagram.
     """
-    count_sorted = sorted(
-        ((freq, key) for key, freq in zip(keys, freqs)), key=lambda x: -x[0]
-    )
-    sorted_freqs = [i[0] for i in count_sorted[:num_clusters_to_plot]]
-    sorted_keys = [str(i[1]) for i in count_sorted[:num_clusters_to_plot]]
+    keys = list(keys)
+    freqs = np.asarray(freqs)
+    num_clusters_to_plot = min(num_clusters_to_plot, freqs.size)
+    if num_clusters_to_plot > 0:
+        # Find the smallest plotted frequency in linear time. All larger
+        # clusters are plotted, and clusters tied with it fill the remaining
+        # slots in input order, matching a stable sort of all clusters.
+        cutoff = freqs[
+            np.argpartition(-freqs, num_clusters_to_plot - 1)[num_clusters_to_plot - 1]
+        ]
+        above = np.flatnonzero(freqs > cutoff)
+        ties = np.flatnonzero(freqs == cutoff)[: num_clusters_to_plot - above.size]
+        idx = np.concatenate([above, ties])
+        idx = idx[np.argsort(-freqs[idx], kind="stable")]
+    else:
+        idx = np.empty(0, dtype=np.intp)
+    sorted_freqs = freqs[idx].tolist()
+    sorted_keys = [str(keys[i]) for i in idx]
     return bar_plot(
         sorted_keys,
         sorted_freqs,
@@ -345,14 +369,13 @@ def pmft_plot(pmft, ax=None, cmap="viridis"):
         fig = plt.figure()
         ax = fig.subplots()
 
-    pmft_arr = np.copy(pmft.pmft)
-    pmft_arr[np.isinf(pmft_arr)] = np.nan
+    pmft_arr = np.where(np.isfinite(pmft.pmft), pmft.pmft, np.nan)
 
     xlims, ylims = pmft.bounds
     ax.set_xlim(xlims)
     ax.set_ylim(ylims)
-    ax.xaxis.set_ticks([i for i in range(int(xlims[0]), int(xlims[1] + 1))])
-    ax.yaxis.set_ticks([i for i in range(int(ylims[0]), int(ylims[1] + 1))])
+    ax.xaxis.set_ticks(np.arange(int(xlims[0]), int(xlims[1] + 1)))
+    ax.yaxis.set_ticks(np.arange(int(ylims[0]), int(ylims[1] + 1)))
     ax.set_xlabel(r"$x$")
     ax.set_ylabel(r"$y$")
     ax.set_title("PMFT")
@@ -361,8 +384,9 @@ def pmft_plot(pmft, ax=None, cmap="viridis"):
     cax = ax_divider.append_axes("right", size="7%", pad="10%")
 
     im = ax.imshow(
-        np.flipud(pmft_arr),
+        pmft_arr,
         extent=[xlims[0], xlims[1], ylims[0], ylims[1]],
+        origin="lower",
         interpolation="nearest",
         cmap=cmap,
         vmin=-2.5,
@@ -406,7 +430,7 @@ def density_plot(density, box, ax=None):
     cax = ax_divider.append_axes("right", size="7%", pad="10%")
 
     im = ax.imshow(
-        np.flipud(density.T), extent=[xlims[0], xlims[1], ylims[0], ylims[1]]
+        density.T, extent=[xlims[0], xlims[1], ylims[0], ylims[1]], origin="lower"
     )
 
     cb = Colorbar(cax, im)
@@ -442,19 +466,29 @@ def voronoi_plot(voronoi, box, ax=None, color_by=None, cmap=None):
         fig = plt.figure()
         ax = fig.subplots()
 
-    # Draw Voronoi polytopes
-    patches = [Polygon(poly[:, :2]) for poly in voronoi.polytopes]
-    patch_collection = PatchCollection(patches, edgecolors="black", alpha=0.4)
+    # Draw Voronoi polytopes. The polytopes property is rebuilt on every
+    # access, so fetch it only once.
+    polytopes = voronoi.polytopes
+    verts = [poly[:, :2] for poly in polytopes]
+    patch_collection = PolyCollection(verts, edgecolors="black", alpha=0.4)
 
     if color_by == "sides":
-        colors = np.array([len(poly) for poly in voronoi.polytopes])
-        num_colors = np.ptp(colors) + 1
+        colors = np.fromiter(
+            (len(poly) for poly in polytopes), dtype=np.int32, count=len(polytopes)
+        )
+        # Side counts are small integers, so one bincount pass gives the range
+        present = np.flatnonzero(np.bincount(colors))
+        color_min, color_max = present[0], present[-1]
+        num_colors = color_max - color_min + 1
     elif color_by == "area":
         colors = voronoi.volumes
+        color_min, color_max = colors.min(), colors.max()
         num_colors = None  # creates a continuous colormap
     elif color_by is None:
-        colors = np.random.RandomState().permutation(np.arange(len(patches)))
-        num_colors = np.unique(colors).size
+        # A permutation of the cell indices, so every color is unique
+        colors = _RNG.permutation(len(verts))
+        color_min, color_max = 0, len(verts) - 1
+        num_colors = len(verts)
     else:
         msg = f"Invalid color_by option {color_by}."
         raise RuntimeError(msg)
@@ -476,7 +510,7 @@ def voronoi_plot(voronoi, box, ax=None, color_by=None, cmap=None):
             cmap = "tab20"
 
     cmap = cm.get_cmap(cmap, num_colors)
-    bounds = np.arange(np.min(colors), np.max(colors) + 1)
+    bounds = np.arange(color_min, color_max + 1)
 
     patch_collection.set_array(np.array(colors) - 0.5)
     patch_collection.set_cmap(cmap)
@@ -484,16 +518,15 @@ def voronoi_plot(voronoi, box, ax=None, color_by=None, cmap=None):
     ax.add_collection(patch_collection)
 
     # Draw box
-    corners = [[0, 0, 0], [0, 1, 0], [1, 1, 0], [1, 0, 0]]
-    # Need to copy the last point so that the box is closed.
-    corners.append(corners[0])
-    corners = box.make_absolute(corners)[:, :2]
+    corners = box.make_absolute(_UNIT_CORNERS_2D)[:, :2]
     ax.plot(corners[:, 0], corners[:, 1], color="k")
 
     # Set title, limits, aspect
     ax.set_title("Voronoi Diagram")
-    ax.set_xlim((np.min(corners[:, 0]), np.max(corners[:, 0])))
-    ax.set_ylim((np.min(corners[:, 1]), np.max(corners[:, 1])))
+    lo = corners.min(axis=0)
+    hi = corners.max(axis=0)
+    ax.set_xlim((lo[0], hi[0]))
+    ax.set_ylim((lo[1], hi[1]))
     ax.set_aspect("equal", "datalim")
 
     # Add colorbar for number of sides
@@ -546,10 +579,10 @@ def diffraction_plot(
         ax = fig.subplots()
 
     # Plot the diffraction image and color bar
-    norm = matplotlib.colors.LogNorm(vmin=vmin, vmax=vmax)
+    norm = matplotlib.colors.LogNorm(vmin=vmin, vmax=vmax, clip=True)
     extent = (np.min(k_values), np.max(k_values), np.min(k_values), np.max(k_values))
     im = ax.imshow(
-        np.clip(diffraction, vmin, vmax),
+        diffraction,
         interpolation="nearest",
         cmap=cmap,
         norm=norm,
@@ -205,6 +205,17 @@ class TestCluster:
         clust._repr_png_()
         plt.close("all")
 
+    def test_clusters_plot_tie_order(self):
+        # Clusters tied in size at the cutoff are plotted in input order
+        freqs = [3] + [1] * 11 + [2] + [1] * 22
+        keys = range(len(freqs))
+        ax = freud.plot.clusters_plot(keys, freqs, num_clusters_to_plot=3)
+        labels = [label.get_text() for label in ax.get_xticklabels()]
+        assert labels == ["0", "12", "1"]
+        heights = [patch.get_height() for patch in ax.patches]
+        npt.assert_equal(heights, [3, 2, 1])
+        plt.close("all")
+
 
 class TestClusterManagedArray(ManagedArrayTestBase):
     def build_object(self):